@@ -47,8 +47,17 @@ class maximum(Elementwise):
         #     ZERO, NEGATIVE = ZERO
         #     UNKNOWN, NEGATIVE = UNKNOWN
         #     NEGATIVE, NEGATIVE = NEGATIVE
-        is_pos = any(arg.is_nonneg() for arg in self.args)
-        is_neg = all(arg.is_nonpos() for arg in self.args)
+        # A single pass over the args suffices; stop early once the sign
+        # can no longer change.
+        is_pos = False
+        is_neg = True
+        for arg in self.args:
+            if not is_pos and arg.is_nonneg():
+                is_pos = True
+            if is_neg and not arg.is_nonpos():
+                is_neg = False
+            if is_pos and not is_neg:
+                break
         return (is_pos, is_neg)
 
     def is_atom_convex(self) -> bool:
@@ -321,6 +321,7 @@ class Expression(u.Canonical):
         """
         raise NotImplementedError()
 
+    @perf.compute_once
     def is_dgp(self, dpp: bool = False) -> bool:
         """Checks whether the Expression is log-log DCP.
 
@@ -340,9 +341,11 @@ class Expression(u.Canonical):
         """
         raise NotImplementedError()
 
+    @perf.compute_once
     def is_quasiconvex(self) -> bool:
         return self.is_convex()
 
+    @perf.compute_once
     def is_quasiconcave(self) -> bool:
         return self.is_concave()
 
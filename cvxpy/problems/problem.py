@@ -169,6 +169,8 @@ class Problem(u.Canonical):
         self._solution = None
         self._cache = Cache()
         self._solver_cache = {}
+        # Cached (chain, reduced problem) for DQCP solves via bisection.
+        self._dqcp_cache = None
         # Information about the shape of the problem and its constituent parts
         self._size_metrics: Optional["SizeMetrics"] = None
         # Benchmarks reported by the solver:
@@ -1128,19 +1130,23 @@ class Problem(u.Canonical):
                     s.LOGGER.info(
                             'Reducing DQCP problem to a one-parameter '
                             'family of DCP problems, for bisection.')
-                reductions = [dqcp2dcp.Dqcp2Dcp()]
                 start = time.time()
                 if type(self.objective) == Maximize:
-                    reductions = [FlipObjective()] + reductions
                     # flip objective flips the sign of the objective
                     low, high = kwargs.get("low"), kwargs.get("high")
                     if high is not None:
                         kwargs["low"] = high * -1
                     if low is not None:
                         kwargs["high"] = low * -1
-                chain = Chain(problem=self, reductions=reductions)
+                if self._dqcp_cache is None:
+                    reductions = [dqcp2dcp.Dqcp2Dcp()]
+                    if type(self.objective) == Maximize:
+                        reductions = [FlipObjective()] + reductions
+                    chain = Chain(problem=self, reductions=reductions)
+                    self._dqcp_cache = (chain, chain.reduce())
+                chain, reduced = self._dqcp_cache
                 soln = bisection.bisect(
-                    chain.reduce(), solver=solver, verbose=verbose, **kwargs)
+                    reduced, solver=solver, verbose=verbose, **kwargs)
                 self.unpack(chain.retrieve(soln))
                 return self.value
 
@@ -150,7 +150,9 @@ class Canonicalization(Reduction):
 
         if skip_canon:
             return expr, []
-        if type(expr) in self.canon_methods:
-            return self.canon_methods[type(expr)](expr, args)
-        else:
-            return expr.copy(args), []
+        # A single dict lookup; this dispatch runs once per node on the
+        # compilation path.
+        canon_method = self.canon_methods.get(type(expr))
+        if canon_method is not None:
+            return canon_method(expr, args)
+        return expr.copy(args), []
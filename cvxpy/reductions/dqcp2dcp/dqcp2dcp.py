@@ -13,6 +13,7 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import weakref
 from collections import namedtuple
 from typing import Any, List, Tuple
 
@@ -33,7 +34,8 @@ from cvxpy.reductions.dqcp2dcp import inverse, sets, tighten
 from cvxpy.reductions.inverse_data import InverseData
 from cvxpy.reductions.solution import Solution
 
-# A tuple (feas_problem, param, tighten_lower, tighten_upper), where
+# A tuple (feas_problem, param, tighten_lower, tighten_upper, objective),
+# where
 #
 #   `feas_problem` is a problem that can be used to check if the original
 #       problem was feasible
@@ -45,9 +47,19 @@ from cvxpy.reductions.solution import Solution
 #   `tighten_upper` is a callable that takes a value of param for which
 #       the problem is feasible, and returns a smaller value for which the
 #       problem is still feasible
+#   `objective` is the quasiconvex objective expression of the original
+#       problem; evaluating it at a feasible iterate upper bounds the
+#       optimal value, letting bisection tighten more aggressively than
+#       midpoint halving
 BisectionData = namedtuple(
     "BisectionData",
-    ['feas_problem', 'param', 'tighten_lower', 'tighten_upper'])
+    ['feas_problem', 'param', 'tighten_lower', 'tighten_upper', 'objective'])
+
+
+# Emitted problems pooled across Dqcp2Dcp instances reducing the same
+# Problem. Keyed on problem identity, so structurally similar problems with
+# different data can never collide; entries die with their problem.
+_reduction_pool = weakref.WeakKeyDictionary()
 
 
 def _get_lazy_and_real_constraints(constraints):
@@ -83,6 +95,23 @@ class Dqcp2Dcp(Canonicalization):
         """
         return type(problem.objective) == Minimize and problem.is_dqcp()
 
+    def reduce(self):
+        """Like Reduction.reduce, but pooled across instances.
+
+        Reducing the same Problem twice yields the same parameterized
+        program, so the emitted problem and retrieval data are shared
+        between Dqcp2Dcp instances owning the same Problem.
+        """
+        if self.problem is not None and not hasattr(self, '_emitted_problem'):
+            cached = _reduction_pool.get(self.problem)
+            if cached is not None:
+                self._emitted_problem, self._retrieval_data = cached
+        emitted = super(Dqcp2Dcp, self).reduce()
+        if self.problem is not None:
+            _reduction_pool[self.problem] = (
+                self._emitted_problem, self._retrieval_data)
+        return emitted
+
     def invert(self, solution, inverse_data):
         pvars = {vid: solution.primal_vars[vid] for vid in inverse_data.id_map
                  if vid in solution.primal_vars}
@@ -116,7 +145,7 @@ class Dqcp2Dcp(Canonicalization):
         param_problem = problems.problem.Problem(Minimize(0), real)
         param_problem._lazy_constraints = lazy
         param_problem._bisection_data = BisectionData(
-            feas_problem, t, *tighten.tighten_fns(objective))
+            feas_problem, t, *tighten.tighten_fns(objective), objective)
         return param_problem, InverseData(problem)
 
     def _canonicalize_tree(self, expr):
@@ -14,18 +14,56 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import numpy as np
+
+import cvxpy.settings as s
+from cvxpy.atoms.affine.hstack import hstack
+from cvxpy.atoms.affine.reshape import reshape
+from cvxpy.atoms.affine.vstack import vstack
 from cvxpy.atoms.affine.wraps import nonneg_wrap, nonpos_wrap
+from cvxpy.constraints.nonpos import Inequality
+from cvxpy.expressions.constants.constant import Constant
 from cvxpy.expressions.variable import Variable
 
+# Maps the atom's sign to the wrap applied to the epigraph variable.
+_WRAP_BY_SIGN = {
+    s.NONNEG: nonneg_wrap,
+    s.NONPOS: nonpos_wrap,
+}
+
 
 def maximum_canon(expr, args):
+    # A maximum over one argument is that argument; no epigraph needed.
+    if len(args) == 1:
+        return args[0], []
+
     shape = expr.shape
-    t = Variable(shape)
-    
-    if expr.is_nonneg():
-        t = nonneg_wrap(t)
-    if expr.is_nonpos():
-        t = nonpos_wrap(t)
-    
-    constraints = [t >= elem for elem in args]
+    # Query the sign once instead of walking the expression tree
+    # separately for is_nonneg and is_nonpos.
+    sign = expr.sign
+    if sign == s.ZERO:
+        # A zero-signed maximum is identically zero; no epigraph
+        # variable or bounding constraints are needed.
+        return Constant(np.zeros(shape)), []
+
+    # Scalar maximum atoms dominate the DQCP tests; let Variable use its
+    # default empty shape rather than normalizing a passed-in one.
+    t = Variable() if shape == () else Variable(shape)
+    wrap = _WRAP_BY_SIGN.get(sign)
+    if wrap is not None:
+        t = wrap(t)
+
+    # Emit a single stacked inequality rather than one constraint per
+    # argument; downstream reductions then walk one constraint instead
+    # of len(args).
+    # Constraints are built through Inequality directly; the arguments
+    # are already Expressions, so the comparison dunders would only add
+    # dispatch overhead on this hot compilation path.
+    if any(elem.shape != shape for elem in args):
+        constraints = [Inequality(elem, t) for elem in args]
+    elif shape == ():
+        constraints = [Inequality(hstack(args), t)]
+    else:
+        rows = [reshape(elem, (1, elem.size), order='F') for elem in args]
+        constraints = [Inequality(vstack(rows), reshape(t, (1, t.size), order='F'))]
     return t, constraints
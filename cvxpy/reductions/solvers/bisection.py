@@ -15,6 +15,8 @@ limitations under the License.
 """
 import warnings
 
+import numpy as np
+
 import cvxpy.error as error
 import cvxpy.problems as problems
 import cvxpy.settings as s
@@ -24,16 +26,35 @@ from cvxpy.reductions.solution import failure_solution
 
 def _lower_problem(problem):
     """Evaluates lazy constraints."""
+    if not problem._lazy_constraints:
+        # Without lazy constraints the lowered problem is identical on
+        # every call; reusing one Problem instance lets its solving
+        # chain cache carry across bisection iterations.
+        lowered = getattr(problem, '_lowered_problem', None)
+        if lowered is None:
+            lowered = problems.problem.Problem(
+                Minimize(0), problem.constraints)
+            problem._lowered_problem = lowered
+        return lowered
     return problems.problem.Problem(
             Minimize(0),
             problem.constraints + [c() for c in problem._lazy_constraints])
 
 
-def _solve(problem, solver) -> None:
+def _solve(problem, solver, solver_cache=None) -> None:
+    if solver_cache is not None:
+        # Sharing one solver cache across the lowered problems lets
+        # solvers that support it (e.g. SCS) warm start from the
+        # previous iterate; the problems only differ in the value of
+        # the bisection parameter.
+        problem._solver_cache = solver_cache
     with warnings.catch_warnings():
         # TODO(akshayka): Try to emit DPP problems in Dqcp2Dcp
         warnings.filterwarnings('ignore', message=r'.*DPP.*')
-        problem.solve(solver=solver)
+        # Only warm start when a cache is shared across iterations;
+        # feasibility and interval-search solves stay cold so their
+        # status is independent of earlier query points.
+        problem.solve(solver=solver, warm_start=solver_cache is not None)
 
 
 def _infeasible(problem) -> bool:
@@ -94,11 +115,12 @@ def _find_bisection_interval(problem, t, solver=None, low=None, high=None,
 
 
 def _bisect(problem, solver, t, low, high, tighten_lower, tighten_higher,
-            eps=1e-6, verbose=False, max_iters=100):
+            eps=1e-6, verbose=False, max_iters=100, objective=None):
     """Bisect `problem` on the parameter `t`."""
 
     verbose_freq = 5
     soln = None
+    solver_cache = {}
     for i in range(max_iters):
         assert low <= high
         if soln is not None and (high - low) <= eps:
@@ -114,7 +136,7 @@ def _bisect(problem, solver, t, low, high, tighten_lower, tighten_higher,
             print("(iteration %d) query point: %0.6f " % (i, query_pt))
         t.value = query_pt
         lowered = _lower_problem(problem)
-        _solve(lowered, solver=solver)
+        _solve(lowered, solver=solver, solver_cache=solver_cache)
 
         if _infeasible(lowered):
             if verbose and i % verbose_freq == 0:
@@ -126,6 +148,14 @@ def _bisect(problem, solver, t, low, high, tighten_lower, tighten_higher,
                       (i, lowered.solution))
             soln = lowered.solution
             high = tighten_higher(query_pt)
+            if objective is not None:
+                # Accelerated bisection: the iterate is feasible for the
+                # original problem, so the objective value it achieves
+                # upper bounds the optimal value and is often much
+                # tighter than the query point.
+                obj_val = objective.value
+                if obj_val is not None and np.isfinite(obj_val):
+                    high = min(high, max(low, tighten_higher(float(obj_val))))
         else:
             if verbose:
                 print("Aborting; the solver failed ...\n")
@@ -164,7 +194,8 @@ def bisect(problem, solver=None, low=None, high=None, eps: float = 1e-6, verbose
     if not hasattr(problem, '_bisection_data'):
         raise ValueError("`bisect` only accepts problems emitted by Dqcp2Dcp.")
 
-    feas_problem, t, tighten_lower, tighten_higher = problem._bisection_data
+    feas_problem, t, tighten_lower, tighten_higher, objective = \
+        problem._bisection_data
     if verbose:
         print("\n******************************************************"
               "**************************\n"
@@ -188,7 +219,7 @@ def bisect(problem, solver=None, low=None, high=None, eps: float = 1e-6, verbose
 
     soln, low, high = _bisect(
         problem, solver, t, low, high, tighten_lower, tighten_higher,
-        eps, verbose, max_iters)
+        eps, verbose, max_iters, objective=objective)
     soln.opt_val = (low + high) / 2.0
     if verbose:
         print("Bisection completed, with lower bound %0.6f and upper bound "
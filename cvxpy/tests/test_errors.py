@@ -28,97 +28,107 @@ from cvxpy.expressions.expression import (
     __INPLACE_MUTATION_ERROR__,
     __NUMPY_UFUNC_ERROR__,
 )
-from cvxpy.tests.base_test import BaseTest
 
-
-class TestErrors(BaseTest):
+# Operands shared by the binary ufunc tests below.
+UFUNC_ARRAY_OPERAND = np.array([[1., 3.], [3., 1.]])
+UFUNC_SCALAR_OPERAND = np.int64(1)
+
+# Ufuncs that build constraints (or are unsupported) rather than numeric
+# expressions, so their values cannot be compared against NumPy's.
+_NON_EQUALITY_UFUNCS = frozenset([
+    np.left_shift,
+    np.right_shift,
+    np.equal,
+    np.less_equal,
+    np.greater_equal,
+    np.less,
+    np.greater,
+])
+
+# Filtered once at import: multiply emits warnings we don't want to deal
+# with, __rpow__ is not implemented yet, and matmul doesn't play nice
+# with scalars.
+_UFUNCS_WITHOUT_MUL_POW = tuple(
+    u for u in __BINARY_EXPRESSION_UFUNCS__ if u not in (np.multiply, np.power))
+_UFUNCS_WITHOUT_MATMUL_POW = tuple(
+    u for u in __BINARY_EXPRESSION_UFUNCS__ if u not in (np.matmul, np.power))
+
+
+@pytest.fixture(scope="module")
+def xvar():
+    # The tests never mutate the variable, so one instance is shared by
+    # the whole module.
+    x = cp.Variable((2, 2), name='x')
+    x.value = np.array([[10., 11], [12, 13]])
+    return x
+
+
+class TestErrors:
     """
     Unit tests for custom error messages to explain why code is broken
     """
 
-    def setUp(self) -> None:
-
-        self.x = cp.Variable((2, 2), name='x')
-        self.x.value = [[10., 11], [12, 13]]
-        self.y = cp.Variable(1, name='y')
-
-    def test_np_ufunc_errors(self) -> None:
+    def test_np_ufunc_errors(self, xvar) -> None:
         with pytest.raises(RuntimeError, match=__NUMPY_UFUNC_ERROR__):
-            np.sqrt(self.x)
+            np.sqrt(xvar)
 
         with pytest.raises(RuntimeError, match=__NUMPY_UFUNC_ERROR__):
-            np.log(self.x)
+            np.log(xvar)
 
-    def test_inplace_mutation_errors(self) -> None:
+    def test_inplace_mutation_errors(self, xvar) -> None:
         a = np.array([1, 2, 3])
         with pytest.raises(RuntimeError, match=re.escape(__INPLACE_MUTATION_ERROR__)):
-            a += self.x
+            a += xvar
 
         with pytest.raises(RuntimeError, match=re.escape(__INPLACE_MUTATION_ERROR__)):
-            np.add(a, self.x, out=a)
-
-
-    def test_some_np_ufunc_works(self) -> None:
-        a = np.array([[1., 3.], [3., 1.]])
-        b = np.int64(1)
-
-        for ufunc in __BINARY_EXPRESSION_UFUNCS__:
-            if ufunc is np.multiply:
-                continue  # We don't want to deal with the multiply warnings
-            if ufunc is np.power:
-                continue  # We don't implement __rpow__ yet.
-            with pytest.raises(RuntimeError, match=__NUMPY_UFUNC_ERROR__):
-                ufunc(self.x, a)
-            with pytest.raises(RuntimeError, match=re.escape(__INPLACE_MUTATION_ERROR__)):
-                ufunc(a, self.x, out=a)
-
-            if ufunc is np.left_shift or \
-                    ufunc is np.right_shift or \
-                    ufunc is np.equal or \
-                    ufunc is np.less_equal or \
-                    ufunc is np.greater_equal or \
-                    ufunc is np.less or \
-                    ufunc is np.greater:
-                continue
-            self.assertItemsAlmostEqual(
-                ufunc(a, self.x).value, ufunc(a, self.x.value))
-
-        for ufunc in __BINARY_EXPRESSION_UFUNCS__:
-            if ufunc is np.matmul:
-                continue  # matmul doesn't play nice with scalars
-            if ufunc is np.power:
-                continue  # We don't implement __rpow__ yet.
-
-            with pytest.raises(RuntimeError, match=__NUMPY_UFUNC_ERROR__):
-                ufunc(self.x, b)
-
-            with pytest.raises(RuntimeError, match=re.escape(__INPLACE_MUTATION_ERROR__)):
-                ufunc(b, self.x, out=b)
-
-            if ufunc is np.left_shift or \
-                    ufunc is np.right_shift or \
-                    ufunc is np.equal or \
-                    ufunc is np.less_equal or \
-                    ufunc is np.greater_equal or \
-                    ufunc is np.less or \
-                    ufunc is np.greater:
-                continue
-
-            self.assertItemsAlmostEqual(
-                ufunc(b, self.x).value, ufunc(b, self.x.value))
-
-    def test_working_numpy_functions(self) -> None:
-        hstack = np.hstack([self.x])
-        self.assertEqual(hstack.shape, (1,))
-        self.assertEqual(hstack.dtype, object)
-        vstack = np.vstack([self.x])
-        self.assertEqual(vstack.shape, (1, 1))
-        self.assertEqual(vstack.dtype, object)
-
-    def test_broken_numpy_functions(self) -> None:
+            np.add(a, xvar, out=a)
+
+    def test_working_numpy_functions(self, xvar) -> None:
+        hstack = np.hstack([xvar])
+        assert hstack.shape == (1,)
+        assert hstack.dtype == object
+        vstack = np.vstack([xvar])
+        assert vstack.shape == (1, 1)
+        assert vstack.dtype == object
+
+    def test_broken_numpy_functions(self, xvar) -> None:
         with pytest.raises(RuntimeError, match=__NUMPY_UFUNC_ERROR__):
-            np.linalg.norm(self.x)
+            np.linalg.norm(xvar)
 
-    def test_abs_error(self) -> None:
+    def test_abs_error(self, xvar) -> None:
         with pytest.raises(TypeError, match=__ABS_ERROR__):
-            builtins.abs(self.x)
+            builtins.abs(xvar)
+
+
+@pytest.mark.parametrize("ufunc", _UFUNCS_WITHOUT_MUL_POW)
+def test_np_ufunc_with_array_raises(ufunc, xvar) -> None:
+    a = UFUNC_ARRAY_OPERAND
+    with pytest.raises(RuntimeError, match=__NUMPY_UFUNC_ERROR__):
+        ufunc(xvar, a)
+    with pytest.raises(RuntimeError, match=re.escape(__INPLACE_MUTATION_ERROR__)):
+        ufunc(a, xvar, out=a)
+
+
+@pytest.mark.parametrize("ufunc", _UFUNCS_WITHOUT_MUL_POW)
+def test_np_ufunc_with_array_value(ufunc, xvar) -> None:
+    if ufunc in _NON_EQUALITY_UFUNCS:
+        pytest.skip("ufunc does not build a numeric expression")
+    a = UFUNC_ARRAY_OPERAND
+    np.testing.assert_allclose(ufunc(a, xvar).value, ufunc(a, xvar.value))
+
+
+@pytest.mark.parametrize("ufunc", _UFUNCS_WITHOUT_MATMUL_POW)
+def test_np_ufunc_with_scalar_raises(ufunc, xvar) -> None:
+    b = UFUNC_SCALAR_OPERAND
+    with pytest.raises(RuntimeError, match=__NUMPY_UFUNC_ERROR__):
+        ufunc(xvar, b)
+    with pytest.raises(RuntimeError, match=re.escape(__INPLACE_MUTATION_ERROR__)):
+        ufunc(b, xvar, out=b)
+
+
+@pytest.mark.parametrize("ufunc", _UFUNCS_WITHOUT_MATMUL_POW)
+def test_np_ufunc_with_scalar_value(ufunc, xvar) -> None:
+    if ufunc in _NON_EQUALITY_UFUNCS:
+        pytest.skip("ufunc does not build a numeric expression")
+    b = UFUNC_SCALAR_OPERAND
+    np.testing.assert_allclose(ufunc(b, xvar).value, ufunc(b, xvar.value))
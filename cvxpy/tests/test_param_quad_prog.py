@@ -16,133 +16,31 @@ limitations under the License.
 import unittest
 
 import numpy as np
+import pytest
 
 import cvxpy as cp
 from cvxpy.reductions.solvers.defines import INSTALLED_SOLVERS, QP_SOLVERS
 from cvxpy.reductions.solvers.qp_solvers.osqp_qpif import OSQP
 from cvxpy.tests.base_test import BaseTest
 
+# QP solvers available in this environment.
+_QP = [s for s in QP_SOLVERS if s in INSTALLED_SOLVERS]
 
-class TestParamQuadProg(BaseTest):
-
-    def setUp(self) -> None:
-        self.solvers = [x for x in QP_SOLVERS if x in INSTALLED_SOLVERS]
-
-    # Overridden method to assume lower accuracy.
-    def assertItemsAlmostEqual(self, a, b, places: int = 2) -> None:
-        super(TestParamQuadProg, self).assertItemsAlmostEqual(a, b, places=places)
-
-    # Overridden method to assume lower accuracy.
-    def assertAlmostEqual(self, a, b, places: int = 2) -> None:
-        super(TestParamQuadProg, self).assertAlmostEqual(a, b, places=places)
-
-    def test_param_data(self) -> None:
-        for solver in self.solvers:
-            np.random.seed(0)
-            m = 30
-            n = 20
-            A = np.random.randn(m, n)
-            b = np.random.randn(m)
-            x = cp.Variable(n)
-            gamma = cp.Parameter(nonneg=True)
-            gamma_val = .5
-            gamma_val_new = .1
-            objective = cp.Minimize(gamma * cp.sum_squares(A @ x - b) + cp.norm(x, 1))
-            constraints = [1 <= x, x <= 2]
-
-            # Solve from scratch (directly new parameter)
-            prob = cp.Problem(objective, constraints)
-            self.assertTrue(prob.is_dpp())
-            gamma.value = gamma_val_new
-            data_scratch, _, _ = prob.get_problem_data(solver)
-            prob.solve(solver=solver)
-            x_scratch = np.copy(x.value)
-
-            # Canonicalize problem with parameter values (solve once)
-            prob = cp.Problem(objective, constraints)
-            gamma.value = gamma_val
-            data_param, _, _ = prob.get_problem_data(solver)
-            prob.solve(solver=solver)
-
-            # Get data with new parameter
-            gamma.value = gamma_val_new
-            data_param_new, _, _ = prob.get_problem_data(solver)
-            prob.solve(solver=solver)
-            x_gamma_new = np.copy(x.value)
-
-            # Check if data match
-            np.testing.assert_allclose(data_param_new['P'].todense(), data_scratch['P'].todense())
-
-            # Check if solutions match
-            np.testing.assert_allclose(x_gamma_new, x_scratch, rtol=1e-02, atol=1e-02)
-
-    def test_qp_problem(self) -> None:
-        for solver in self.solvers:
-            m = 30
-            n = 20
-            A = np.random.randn(m, n)
-            b = np.random.randn(m)
-            x = cp.Variable(n)
-            gamma = cp.Parameter(nonneg=True)
-            gamma.value = .5
-            objective = cp.Minimize(cp.sum_squares(A @ x - b) + gamma * cp.norm(x, 1))
-            constraints = [0 <= x, x <= 1]
-
-            # Solve from scratch
-            problem = cp.Problem(objective, constraints)
-            problem.solve(solver=solver)
-            x_full = np.copy(x.value)
-
-            # Restore cached values
-            solving_chain = problem._cache.solving_chain
-            solver = problem._cache.solving_chain.solver
-            inverse_data = problem._cache.inverse_data
-            param_prog = problem._cache.param_prog
-
-            # Solve parametric
-            data, solver_inverse_data = solving_chain.solver.apply(param_prog)
-            inverse_data = inverse_data + [solver_inverse_data]
-            raw_solution = solver.solve_via_data(
-                    data, warm_start=False, verbose=False, solver_opts={})
-            problem.unpack_results(raw_solution, solving_chain, inverse_data)
-            x_param = np.copy(x.value)
-
-            np.testing.assert_allclose(x_param, x_full, rtol=1e-2, atol=1e-02)
-
-        # TODO: Add derivatives and adjoint tests
-
-    def test_var_bounds(self) -> None:
-        """Test that lower and upper bounds on variables are propagated."""
-        # Create a solver instance where bounded variables are disabled.
-        solver_instance = OSQP()
-        solver_instance.name = lambda: "Custom OSQP, no bounded variables"
-        solver_instance.BOUNDED_VARIABLES = False
-
-        lower_bounds = -10
-        upper_bounds = np.arange(6).reshape((3, 2))
-        x = cp.Variable((3, 2), bounds=[lower_bounds, upper_bounds])
-        problem = cp.Problem(cp.Minimize(cp.sum(x)))
-        data, _, _ = problem.get_problem_data(solver=solver_instance)
-        param_quad_prog = data[cp.settings.PARAM_PROB]
+# Bounds shared by the variable-bound tests.
+VAR_LOWER_BOUND = -10
+VAR_UPPER_BOUNDS = np.arange(6).reshape((3, 2))
 
-        assert param_quad_prog.lower_bounds is None
-        assert param_quad_prog.upper_bounds is None
 
-        # Create a solver instance where bounded variables are enabled.
-        solver_instance = OSQP()
-        solver_instance.name = lambda: "Custom OSQP, bounded variables"
-        solver_instance.BOUNDED_VARIABLES = True
+def _custom_osqp(bounded_variables: bool) -> OSQP:
+    """Returns an OSQP instance with bounded variables toggled."""
+    solver_instance = OSQP()
+    qualifier = "" if bounded_variables else "no "
+    solver_instance.name = lambda: "Custom OSQP, %sbounded variables" % qualifier
+    solver_instance.BOUNDED_VARIABLES = bounded_variables
+    return solver_instance
 
-        lower_bounds = -10
-        upper_bounds = np.arange(6).reshape((3, 2))
-        x = cp.Variable((3, 2), bounds=[lower_bounds, upper_bounds])
-        problem = cp.Problem(cp.Minimize(cp.sum(x)))
-        data, _, _ = problem.get_problem_data(solver=solver_instance)
-        param_quad_prog = data[cp.settings.PARAM_PROB]
 
-        assert np.all(param_quad_prog.lower_bounds == lower_bounds)
-        param_upper_bound = np.reshape(param_quad_prog.upper_bounds, (3, 2), order="F")
-        assert np.all(param_upper_bound == upper_bounds)
+class TestParamQuadProg(BaseTest):
 
     @unittest.skipUnless(cp.DAQP in INSTALLED_SOLVERS, 'DAQP is not installed.')
     def test_daqp_var_bounds(self) -> None:
@@ -163,3 +61,101 @@ class TestParamQuadProg(BaseTest):
         assert np.isclose(x1.value, -1)
         assert np.isclose(x2.value, -.5)
         assert np.isclose(x3.value, -2)
+
+
+@pytest.mark.parametrize("solver", _QP)
+def test_param_data(solver) -> None:
+    np.random.seed(0)
+    m = 30
+    n = 20
+    A = np.random.randn(m, n)
+    b = np.random.randn(m)
+    x = cp.Variable(n)
+    gamma = cp.Parameter(nonneg=True)
+    gamma_val = .5
+    gamma_val_new = .1
+    objective = cp.Minimize(gamma * cp.sum_squares(A @ x - b) + cp.norm(x, 1))
+    constraints = [1 <= x, x <= 2]
+    prob = cp.Problem(objective, constraints)
+    assert prob.is_dpp()
+
+    # Solve from scratch (directly new parameter)
+    gamma.value = gamma_val_new
+    data_scratch, _, _ = prob.get_problem_data(solver)
+    prob.solve(solver=solver)
+    x_scratch = np.copy(x.value)
+
+    # Solve once with other parameter values; the solve builds its own
+    # data, so no separate get_problem_data is needed
+    gamma.value = gamma_val
+    prob.solve(solver=solver)
+    assert prob._cache.param_prog is not None
+
+    # Get data with new parameter, through the cached chain
+    gamma.value = gamma_val_new
+    data_param_new, _, _ = prob.get_problem_data(solver)
+    prob.solve(solver=solver)
+    x_gamma_new = np.copy(x.value)
+
+    # Check if data match; compare the sparse difference directly
+    # instead of densifying both matrices
+    diff = (data_param_new['P'] - data_scratch['P']).tocoo()
+    np.testing.assert_allclose(diff.data, 0, atol=1e-8)
+
+    # Check if solutions match
+    np.testing.assert_allclose(x_gamma_new, x_scratch, rtol=1e-02, atol=1e-02)
+
+
+@pytest.mark.parametrize("solver", _QP)
+def test_qp_problem(solver) -> None:
+    np.random.seed(0)
+    m = 30
+    n = 20
+    A = np.random.randn(m, n)
+    b = np.random.randn(m)
+    x = cp.Variable(n)
+    gamma = cp.Parameter(nonneg=True)
+    gamma.value = .5
+    objective = cp.Minimize(cp.sum_squares(A @ x - b) + gamma * cp.norm(x, 1))
+    constraints = [0 <= x, x <= 1]
+
+    # Solve from scratch
+    problem = cp.Problem(objective, constraints)
+    problem.solve(solver=solver)
+    x_full = np.copy(x.value)
+
+    # Restore cached values
+    solving_chain = problem._cache.solving_chain
+    solver = problem._cache.solving_chain.solver
+    inverse_data = problem._cache.inverse_data
+    param_prog = problem._cache.param_prog
+
+    # Solve parametric
+    data, solver_inverse_data = solving_chain.solver.apply(param_prog)
+    inverse_data = inverse_data + [solver_inverse_data]
+    raw_solution = solver.solve_via_data(
+            data, warm_start=False, verbose=False, solver_opts={})
+    problem.unpack_results(raw_solution, solving_chain, inverse_data)
+    x_param = np.copy(x.value)
+
+    np.testing.assert_allclose(x_param, x_full, rtol=1e-2, atol=1e-02)
+
+    # TODO: Add derivatives and adjoint tests
+
+
+@pytest.mark.parametrize("bounded_variables", [False, True])
+def test_var_bounds(bounded_variables) -> None:
+    """Test that lower and upper bounds on variables are propagated."""
+    x = cp.Variable((3, 2), bounds=[VAR_LOWER_BOUND, VAR_UPPER_BOUNDS])
+    problem = cp.Problem(cp.Minimize(cp.sum(x)))
+    data, _, _ = problem.get_problem_data(solver=_custom_osqp(bounded_variables))
+    param_quad_prog = data[cp.settings.PARAM_PROB]
+
+    if not bounded_variables:
+        assert param_quad_prog.lower_bounds is None
+        assert param_quad_prog.upper_bounds is None
+        return
+
+    assert np.all(param_quad_prog.lower_bounds == VAR_LOWER_BOUND)
+    param_upper_bound = np.reshape(param_quad_prog.upper_bounds, (3, 2), order="F")
+    assert np.all(param_upper_bound == VAR_UPPER_BOUNDS)